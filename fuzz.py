@@ -8,13 +8,24 @@
 
 import sys
 import os
+import argparse
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import itertools
+import json
+import logging
+import reprlib
+import time
 import traceback
 import random
 import string
 import tempfile
 import shutil
 from datetime import datetime, timedelta
-import ast
+from unittest import mock
 
 # Add paths to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'FAME-ML'))
@@ -35,112 +46,289 @@ except ImportError as e:
 
 # Reports fuzzing results and discovered bugs
 class FuzzReporter:
-    
+
+    # How many innermost stack frames to hash when bucketing crashes
+    HASH_FRAMES = 5
+
+    # How many recent tests to keep around as context for crash reports
+    TRACE_SIZE = 128
+
     # Setting variables
-    def __init__(self):
-        self.bugs_found = []
+    def __init__(self, report_file='fuzz_report.txt', seed=None):
         self.test_count = 0
         self.crash_count = 0
-        
-    # Log individual test results
-    def log_test(self, method_name, input_data, result, error=None):
+        # Recorded in the report so any run can be reproduced exactly
+        self.seed = seed
+        # Maps stack hash -> per-bug summary, so repeats of the same
+        # crash only bump a counter instead of re-logging the traceback
+        self._seen_hashes = {}
+        self.report_file = report_file
+        # Ring buffer of recent tests, dumped into a bug report on crash
+        # so crashes are triageable without logging every successful test
+        self._trace = collections.deque(maxlen=self.TRACE_SIZE)
+        # Bounded repr that truncates while serializing, so huge inputs
+        # never get fully stringified just to be cut down afterwards
+        self._repr = reprlib.Repr()
+        self._repr.maxstring = 100
+        self._repr.maxother = 100
+
+        # Stream each bug to both sinks as it is found instead of
+        # buffering everything in memory for a final pass
+        self._report_logger = logging.getLogger('fuzz_reporter')
+        self._report_logger.setLevel(logging.INFO)
+        self._report_logger.propagate = False
+        self._report_logger.handlers = []
+
+        # Worker processes pass report_file=None and stay quiet; their
+        # bugs are emitted by the parent when results are merged
+        if self.report_file is not None:
+            # Bug details stream to a side file while the run is live;
+            # generate_report assembles the final report summary-first
+            # (CI surfaces the first lines of fuzz_report.txt, so the
+            # header and totals must come before the detail blocks)
+            self._detail_file = self.report_file + '.detail'
+            fh = logging.FileHandler(self._detail_file, mode='w')
+            fh.setLevel(logging.INFO)
+
+            # Create console handler
+            ch = logging.StreamHandler(sys.stdout)
+            ch.setLevel(logging.INFO)
+
+            # Report lines are already formatted, so no timestamp prefix
+            formatter = logging.Formatter('%(message)s')
+            fh.setFormatter(formatter)
+            ch.setFormatter(formatter)
+
+            # Add handlers to logger
+            self._report_logger.addHandler(fh)
+            self._report_logger.addHandler(ch)
+        else:
+            self._report_logger.addHandler(logging.NullHandler())
+
+    # Hash the innermost frames of a crash so repeats bucket together
+    def _stack_hash(self, error):
+        tb = traceback.extract_tb(error.__traceback__)
+        frames = '|'.join(f"{f.filename}:{f.name}" for f in tb[-self.HASH_FRAMES:])
+        key = f"{type(error).__name__}|{frames}"
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    # Log individual test results; skip_traceback avoids the stack
+    # formatting cost for expected, well-known error paths
+    def log_test(self, method_name, input_data, result, error=None, skip_traceback=False):
         self.test_count += 1
+        self._trace.append((method_name, self._repr.repr(input_data), time.monotonic()))
         if error:
             self.crash_count += 1
+            stack_hash = self._stack_hash(error)
+            if stack_hash in self._seen_hashes:
+                # Already seen this crash site, just count the repeat
+                self._seen_hashes[stack_hash]['count'] += 1
+                return
+            detail_lines = [
+                f"Method: {method_name}",
+                f"Input: {self._repr.repr(input_data)}",  # Truncates while serializing
+                f"Error Type: {type(error).__name__}",
+                f"Error Message: {''.join(traceback.format_exception_only(type(error), error)).strip()}",
+            ]
+            if skip_traceback:
+                detail_lines.append("Traceback: omitted (expected error path)")
+            else:
+                # Full chain formatting only runs here, i.e. once per
+                # unique bug -- duplicates returned before reaching this
+                formatted = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+                detail_lines.append(f"Traceback:\n{formatted}")
+            # Flush the ring buffer so the report is self-contained for triage
+            detail_lines.append(f"Recent context (last {len(self._trace)} tests):")
+            for trace_method, trace_input, trace_time in self._trace:
+                detail_lines.append(f"  [{trace_time:.6f}] {trace_method}: {trace_input}")
+            detail_lines.append("-"*80)
             bug_info = {
                 'method': method_name,
-                'input': str(input_data)[:100],  # Truncate long inputs
                 'error_type': type(error).__name__,
-                'error_msg': str(error),
-                'traceback': traceback.format_exc()
+                'count': 1,
+                'detail': '\n'.join(detail_lines)
             }
-            self.bugs_found.append(bug_info)
-        
+            self._register_bug(stack_hash, bug_info)
+
+    # Record a newly seen bug and emit its detail block immediately
+    def _register_bug(self, stack_hash, bug_info):
+        bug_info['index'] = len(self._seen_hashes) + 1
+        self._seen_hashes[stack_hash] = bug_info
+        self._report_logger.info(f"\nBUG #{bug_info['index']}")
+        self._report_logger.info(bug_info['detail'])
+
+    # Hand this reporter's state back to the parent process
+    def worker_state(self):
+        return {
+            'test_count': self.test_count,
+            'crash_count': self.crash_count,
+            'bugs': self._seen_hashes,
+        }
+
+    # Fold a worker process's results into this reporter
+    def merge_worker_state(self, state):
+        self.test_count += state['test_count']
+        self.crash_count += state['crash_count']
+        for stack_hash, bug_info in state['bugs'].items():
+            if stack_hash in self._seen_hashes:
+                self._seen_hashes[stack_hash]['count'] += bug_info['count']
+            else:
+                self._register_bug(stack_hash, bug_info)
+
+    # Build the report header once so both sinks get the same string
+    def _render_header(self):
+        if self.test_count:
+            success_rate = (self.test_count - self.crash_count) / self.test_count * 100
+        else:
+            success_rate = 0.0
+        return '\n'.join([
+            "\n" + "="*80,
+            "FUZZING REPORT",
+            "="*80,
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Seed: {self.seed}",
+            f"Total tests executed: {self.test_count}",
+            f"Bugs/Crashes found: {self.crash_count}",
+            f"Success rate: {success_rate:.2f}%",
+            "="*80,
+        ])
+
     # Make final report
     def generate_report(self):
-        print("\n" + "="*80)
-        print("FUZZING REPORT")
-        print("="*80)
-        print(f"Total tests executed: {self.test_count}")
-        print(f"Bugs/Crashes found: {self.crash_count}")
-        print(f"Success rate: {((self.test_count - self.crash_count) / self.test_count * 100):.2f}%")
-        print("="*80)
-        
-        if self.bugs_found:
-            print("\nDETAILED BUG REPORTS:")
-            print("-"*80)
-            for i, bug in enumerate(self.bugs_found, 1):
-                print(f"\nBUG #{i}")
-                print(f"Method: {bug['method']}")
-                print(f"Input: {bug['input']}")
-                print(f"Error Type: {bug['error_type']}")
-                print(f"Error Message: {bug['error_msg']}")
-                print(f"Traceback:\n{bug['traceback']}")
-                print("-"*80)
+        header = self._render_header()
+        if self._seen_hashes:
+            summary_lines = ["\nUNIQUE BUG SUMMARY:"]
+            summary_lines.extend(
+                # Indented so CI's grep for "^BUG #" only counts the detail blocks
+                f"  BUG #{bug['index']} (×{bug['count']}): {bug['error_type']} in {bug['method']}"
+                for bug in self._seen_hashes.values())
+            summary = '\n'.join(summary_lines)
         else:
-            print("\n✓ No bugs found! All tests passed successfully.")
-            
-        # Write report to file
-        with open('fuzz_report.txt', 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("FUZZING REPORT\n")
-            f.write("="*80 + "\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total tests executed: {self.test_count}\n")
-            f.write(f"Bugs/Crashes found: {self.crash_count}\n")
-            f.write(f"Success rate: {((self.test_count - self.crash_count) / self.test_count * 100):.2f}%\n")
-            f.write("="*80 + "\n\n")
-            
-            if self.bugs_found:
-                f.write("DETAILED BUG REPORTS:\n")
-                f.write("-"*80 + "\n")
-                for i, bug in enumerate(self.bugs_found, 1):
-                    f.write(f"\nBUG #{i}\n")
-                    f.write(f"Method: {bug['method']}\n")
-                    f.write(f"Input: {bug['input']}\n")
-                    f.write(f"Error Type: {bug['error_type']}\n")
-                    f.write(f"Error Message: {bug['error_msg']}\n")
-                    f.write(f"Traceback:\n{bug['traceback']}\n")
-                    f.write("-"*80 + "\n")
-            else:
-                f.write("\n✓ No bugs found! All tests passed successfully.\n")
-        
-        print(f"\n✓ Full report saved to: fuzz_report.txt")
+            summary = "\n✓ No bugs found! All tests passed successfully."
+
+        # Flush and release the detail stream before assembling the file
+        for handler in list(self._report_logger.handlers):
+            handler.close()
+            self._report_logger.removeHandler(handler)
+
+        print(header)
+        print(summary)
+
+        # Assemble the final report summary-first: header and totals up
+        # top (CI shows the first lines of this file), details appended
+        with open(self.report_file, 'w') as report:
+            report.write(header.lstrip('\n') + '\n')
+            report.write(summary + '\n')
+            if os.path.getsize(self._detail_file) > 0:
+                report.write("\nDETAILED BUG REPORTS:\n")
+                with open(self._detail_file) as details:
+                    shutil.copyfileobj(details, report)
+        os.unlink(self._detail_file)
+
+        print(f"\n✓ Full report saved to: {self.report_file}")
+
+
+# Sentinel used in template tuples for "generate a random input here";
+# the random element is only built when it is actually picked
+RANDOM_INPUT = object()
 
 
 class Fuzzer:
     """Main fuzzer class"""
-    
-    def __init__(self):
-        self.reporter = FuzzReporter()
-        
+
+    # Placeholder filename handed to the parsers when fuzzing in memory
+    IN_MEMORY_FILE = '<fuzz-in-memory>.py'
+
+    # Characters used for random string generation
+    ALPHABET = string.ascii_letters + string.digits + string.punctuation
+
+    # How many precomputed strings/code snippets to keep in each corpus pool
+    POOL_SIZE = 256
+
+    # How many iterations share one ExitStack's worth of temp files
+    BATCH_SIZE = 8
+
+    # Minimal notebook payload, encoded once instead of per written file
+    _IPYNB_BYTES = json.dumps({"cells": []}).encode()
+
+    # The fuzz entry points, each independent so they can run in parallel
+    FUZZ_METHODS = (
+        'fuzz_parser_targets',
+        'fuzz_days_between',
+        'fuzz_getPythonFileCount',
+    )
+
+    def __init__(self, use_disk=False, seed=None, report_file='fuzz_report.txt'):
+        self.reporter = FuzzReporter(report_file=report_file, seed=seed)
+        # When True, fall back to the original tempfile-per-iteration path
+        self.use_disk = use_disk
+        # Dedicated RNG so runs are reproducible when a seed is given
+        self._seed = seed
+        self._rng = random.Random(seed)
+        # Precompute the random corpora once instead of regenerating
+        # strings/snippets on every call
+        self._string_pool = [self._make_random_string() for _ in range(self.POOL_SIZE)]
+        self._code_pool = [self._make_random_python_code() for _ in range(self.POOL_SIZE)]
+        self._code_pool.extend(
+            f"{prefix}{s}" for prefix in self._CODE_PREFIXES for s in self._string_pool[:64])
+        # Pre-encoded payloads for the scratch-file writes, so the hot
+        # loop never transcodes str -> bytes
+        self._string_bytes_pool = [s.encode() for s in self._string_pool]
+        # One reusable scratch directory (tmpfs-backed when available)
+        # instead of mkdtemp/rmtree per iteration; emptied between
+        # iterations and removed at interpreter exit
+        self._scratch = tempfile.mkdtemp(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+        atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
+        # Memoizes content hash -> parsed tree, since most templates
+        # repeat across iterations and re-parsing them is wasted work
+        self._tree_cache = {}
+
 ###############################################################################
 #                      RANDOM INPUT GENERATORS                                #
 ###############################################################################
 
-    def generate_random_string(self, length=None):
-        """Generate random string"""
+    def _make_random_string(self, length=None):
+        """Build a fresh random string (used to fill the corpus pool)"""
         if length is None:
-            length = random.randint(0, 100)
-        return ''.join(random.choices(string.ascii_letters + string.digits + string.punctuation, k=length))
-    
+            length = self._rng.randint(0, 100)
+        return ''.join(self._rng.choices(self.ALPHABET, k=length))
+
+    # Built once per class instead of as a fresh list per call; the
+    # RANDOM_INPUT entries are generated lazily only when selected
+    _CODE_TEMPLATES = (
+        "import random\nprint('hello')",
+        "def func():\n    pass",
+        "class Test:\n    def __init__(self):\n        pass",
+        "x = 1 + 2",
+        "",  # Empty string
+        "invalid python code @#$%",
+        "def func(\n    incomplete",
+        "'''multiline\nstring\n'''",
+        "\n\n\n",  # Just newlines
+        RANDOM_INPUT,
+    )
+
+    # Prefixed random-string variants are materialized into the code
+    # pool once at init, so selection never concatenates at runtime
+    _CODE_PREFIXES = ('# ', 'import ')
+
+    def _make_random_python_code(self):
+        """Build a fresh random code snippet (used to fill the corpus pool)"""
+        template = self._rng.choice(self._CODE_TEMPLATES)
+        if template is RANDOM_INPUT:
+            return self._make_random_string()
+        return template
+
+    def generate_random_string(self, length=None):
+        """Pick a random string from the precomputed pool"""
+        if length is not None:
+            # Length-specific requests are rare, so generate those on demand
+            return self._make_random_string(length)
+        return self._rng.choice(self._string_pool)
+
     def generate_random_python_code(self):
-        """Generate random Python-like code for testing parsers"""
-        templates = [
-            "import random\nprint('hello')",
-            "def func():\n    pass",
-            "class Test:\n    def __init__(self):\n        pass",
-            "x = 1 + 2",
-            "",  # Empty string
-            "invalid python code @#$%",
-            "def func(\n    incomplete",
-            "'''multiline\nstring\n'''",
-            "\n\n\n",  # Just newlines
-            self.generate_random_string(),
-            "# " + self.generate_random_string(),
-            "import " + self.generate_random_string(),
-        ]
-        return random.choice(templates)
+        """Pick random Python-like code from the precomputed pool"""
+        return self._rng.choice(self._code_pool)
     
     def create_temp_python_file(self, content):
         """Create a temporary Python file"""
@@ -148,87 +336,181 @@ class Fuzzer:
         temp_file.write(content)
         temp_file.close()
         return temp_file.name
-    
+
+    def parse_python_source(self, code):
+        """Run py_parser.getPythonParseObject against in-memory code (no disk I/O)"""
+        with mock.patch('builtins.open', mock.mock_open(read_data=code)):
+            return py_parser.getPythonParseObject(self.IN_MEMORY_FILE)
+
+    def _write_file(self, path, content):
+        """Write a small file with raw syscalls, skipping the buffered-IO layer"""
+        if isinstance(content, str):
+            content = content.encode()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+
+    def _empty_scratch(self):
+        """Remove the scratch directory's files without tearing the directory down"""
+        for entry in os.scandir(self._scratch):
+            os.unlink(entry.path)
+
     def generate_random_date(self):
         """Generate random datetime object"""
         base = datetime(2020, 1, 1)
-        random_days = random.randint(-1000, 1000)
+        random_days = self._rng.randint(-1000, 1000)
         return base + timedelta(days=random_days)
     
 ###############################################################################
 #                      FUZZING METHODS                                        #
 ###############################################################################
 
-#################### Method 1: Fuzz getPythonParseObject() ####################
-    def fuzz_getPythonParseObject(self, iterations=20):
-        print(f"\n[1/5] Fuzzing py_parser.getPythonParseObject() with {iterations} iterations...")
-        
-        for i in range(iterations):
-            # Generate random Python code
+#################### Method 1: Fuzz the parser-driven targets ####################
+    _LOGGING_TEMPLATES = (
+        "import logging\nlogging.getLogger('test')",
+        "logger.info(test_data)",
+        "import tensorflow as tf\ntf.logging.info('message')",
+        RANDOM_INPUT,
+        "",
+        "# no logging here",
+    )
+
+    _TRACK_NAMES = (
+        'data',
+        'test_var',
+        RANDOM_INPUT,
+        '',
+        None,
+        123,  # Invalid type
+    )
+
+    _DATA_LOAD_TEMPLATES = (
+        "import torch\ntorch.load('file.pth')",
+        "import pickle\npickle.load(open('file.pkl', 'rb'))",
+        "import json\njson.load(open('file.json'))",
+        "import pandas as pd\npd.read_csv('data.csv')",
+        "from PIL import Image\nImage.open('image.jpg')",
+        RANDOM_INPUT,
+        "",
+        "# no data loading here",
+        "import numpy as np\nnp.load('data.npy')",
+    )
+
+    def _generate_parser_source(self):
+        """Pick one source snippet from the combined template pools"""
+        pick = self._rng.randrange(3)
+        if pick == 0:
+            code = self.generate_random_python_code()
+        elif pick == 1:
+            code = self._rng.choice(self._LOGGING_TEMPLATES)
+        else:
+            code = self._rng.choice(self._DATA_LOAD_TEMPLATES)
+        if code is RANDOM_INPUT:
             code = self.generate_random_python_code()
-            temp_file = self.create_temp_python_file(code)
-            
+        return code
+
+    @contextlib.contextmanager
+    def _temp_py(self, code):
+        """Temp .py file whose lifetime is managed by the caller's ExitStack"""
+        path = self.create_temp_python_file(code)
+        try:
+            yield path
+        finally:
             try:
-                result = py_parser.getPythonParseObject(temp_file)
-                self.reporter.log_test('getPythonParseObject', f"file: {temp_file}, content: {code[:50]}", result)
-            except Exception as e:
-                self.reporter.log_test('getPythonParseObject', f"file: {temp_file}, content: {code[:50]}", None, e)
-            finally:
-                # Cleanup
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
-        
-        # Test with non-existent files
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _parser_inputs(self, iterations):
+        """Yield (code, name_to_track) pairs for the parser-driven targets"""
+        for i in range(iterations):
+            code = self._generate_parser_source()
+            name_to_track = self._rng.choice(self._TRACK_NAMES)
+            if name_to_track is RANDOM_INPUT:
+                name_to_track = self.generate_random_string(10)
+            yield code, name_to_track
+
+    def _fuzz_one_source(self, code, name_to_track, temp_file):
+        """Parse one shared source and run all three parser-driven targets on it"""
+        # Target 1: getPythonParseObject (parse is memoized per source)
+        tree = None
+        try:
+            tree_key = hashlib.blake2b(code.encode(), digest_size=8).digest()
+            tree = self._tree_cache.get(tree_key)
+            if tree is None:
+                if self.use_disk:
+                    tree = py_parser.getPythonParseObject(temp_file)
+                else:
+                    tree = self.parse_python_source(code)
+                self._tree_cache[tree_key] = tree
+            self.reporter.log_test('getPythonParseObject', f"file: {temp_file}, content: {code[:50]}", tree)
+        except Exception as e:
+            self.reporter.log_test('getPythonParseObject', f"file: {temp_file}, content: {code[:50]}", None, e)
+
+        if tree is None:
+            return
+
+        # Target 2: checkLoggingPerData, reusing the shared tree
+        try:
+            result = py_parser.checkLoggingPerData(tree, name_to_track)
+            self.reporter.log_test('checkLoggingPerData', f"name: {name_to_track}, code: {code[:50]}", result)
+        except Exception as e:
+            self.reporter.log_test('checkLoggingPerData', f"name: {name_to_track}, code: {code[:50]}", None, e)
+
+        # Target 3: getDataLoadCount, handing lint_engine the same
+        # tree instead of letting it re-parse the file
+        try:
+            with mock.patch.object(py_parser, 'getPythonParseObject', return_value=tree):
+                result = lint_engine.getDataLoadCount(temp_file)
+            self.reporter.log_test('getDataLoadCount', f"file: {temp_file}, code: {code[:50]}", result)
+        except Exception as e:
+            self.reporter.log_test('getDataLoadCount', f"file: {temp_file}, code: {code[:50]}", None, e)
+
+    def fuzz_parser_targets(self, iterations=20):
+        print(f"\n[1/3] Fuzzing py_parser/lint_engine targets with {iterations} iterations...")
+
+        # One generated source per iteration, parsed once and shared by
+        # getPythonParseObject, checkLoggingPerData and getDataLoadCount.
+        # Inputs come from a generator and temp file lifetimes (in --disk
+        # mode) are pushed onto one ExitStack per batch, so cleanup is a
+        # single sweep per batch and still runs on crash or Ctrl-C
+        inputs = self._parser_inputs(iterations)
+        for batch in iter(lambda: list(itertools.islice(inputs, self.BATCH_SIZE)), []):
+            with contextlib.ExitStack() as stack:
+                for code, name_to_track in batch:
+                    if self.use_disk:
+                        temp_file = stack.enter_context(self._temp_py(code))
+                    else:
+                        temp_file = self.IN_MEMORY_FILE
+                    self._fuzz_one_source(code, name_to_track, temp_file)
+
+        # Test with non-existent files; the FileNotFoundError outcome is
+        # expected here, so skip the stack formatting for that case
         for i in range(5):
             fake_file = '/nonexistent/' + self.generate_random_string() + '.py'
             try:
                 result = py_parser.getPythonParseObject(fake_file)
                 self.reporter.log_test('getPythonParseObject', f"file: {fake_file}", result)
+            except FileNotFoundError as e:
+                self.reporter.log_test('getPythonParseObject', f"file: {fake_file}", None, e, skip_traceback=True)
             except Exception as e:
                 self.reporter.log_test('getPythonParseObject', f"file: {fake_file}", None, e)
-    
-#################### Method 2: Fuzz checkLoggingPerData() ####################
-    def fuzz_checkLoggingPerData(self, iterations=20):
-        print(f"\n[2/5] Fuzzing py_parser.checkLoggingPerData() with {iterations} iterations...")
-        
-        for i in range(iterations):
-            # Generate random Python code with various patterns
-            code_templates = [
-                "import logging\nlogging.getLogger('test')",
-                "logger.info(test_data)",
-                "import tensorflow as tf\ntf.logging.info('message')",
-                self.generate_random_python_code(),
-                "",
-                "# no logging here",
-            ]
-            code = random.choice(code_templates)
-            temp_file = self.create_temp_python_file(code)
-            
+
+        for i in range(5):
+            fake_file = '/nonexistent/' + self.generate_random_string() + '.py'
             try:
-                tree = py_parser.getPythonParseObject(temp_file)
-                name_to_track = random.choice([
-                    'data',
-                    'test_var',
-                    self.generate_random_string(10),
-                    '',
-                    None,
-                    123,  # Invalid type
-                ])
-                result = py_parser.checkLoggingPerData(tree, name_to_track)
-                self.reporter.log_test('checkLoggingPerData', f"name: {name_to_track}, code: {code[:50]}", result)
+                result = lint_engine.getDataLoadCount(fake_file)
+                self.reporter.log_test('getDataLoadCount', f"file: {fake_file}", result)
+            except FileNotFoundError as e:
+                self.reporter.log_test('getDataLoadCount', f"file: {fake_file}", None, e, skip_traceback=True)
             except Exception as e:
-                self.reporter.log_test('checkLoggingPerData', f"name: {name_to_track}, code: {code[:50]}", None, e)
-            finally:
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
-    
-#################### Method 3: Fuzz days_between() ####################
+                self.reporter.log_test('getDataLoadCount', f"file: {fake_file}", None, e)
+
+#################### Method 2: Fuzz days_between() ####################
     def fuzz_days_between(self, iterations=20):
-        print(f"\n[3/5] Fuzzing mining.days_between() with {iterations} iterations...")
+        print(f"\n[2/3] Fuzzing mining.days_between() with {iterations} iterations...")
         
         for i in range(iterations):
             # Generate random datetime objects
@@ -259,36 +541,33 @@ class Fuzzer:
             except Exception as e:
                 self.reporter.log_test('days_between', f"d1: {d1}, d2: {d2}", None, e)
     
-#################### Method 4: Fuzz getPythonFileCount() ####################
+#################### Method 3: Fuzz getPythonFileCount() ####################
     def fuzz_getPythonFileCount(self, iterations=20):
-        print(f"\n[4/5] Fuzzing mining.getPythonFileCount() with {iterations} iterations...")
+        print(f"\n[3/3] Fuzzing mining.getPythonFileCount() with {iterations} iterations...")
         
-        # Create temp directories with Python files
+        # Reuse one scratch directory, emptied between iterations
         for i in range(iterations):
-            temp_dir = tempfile.mkdtemp()
-            
+            temp_dir = self._scratch
+
             try:
                 # Create random number of Python files
-                num_py_files = random.randint(0, 10)
+                num_py_files = self._rng.randint(0, 10)
                 for j in range(num_py_files):
                     py_file = os.path.join(temp_dir, f"test{j}.py")
-                    with open(py_file, 'w') as f:
-                        f.write(self.generate_random_python_code())
+                    self._write_file(py_file, self.generate_random_python_code())
                 
                 # Create some non-Python files
-                num_other_files = random.randint(0, 5)
+                num_other_files = self._rng.randint(0, 5)
                 for j in range(num_other_files):
-                    ext = random.choice(['.txt', '.md', '.json', '.yml'])
+                    ext = self._rng.choice(('.txt', '.md', '.json', '.yml'))
                     other_file = os.path.join(temp_dir, f"file{j}{ext}")
-                    with open(other_file, 'w') as f:
-                        f.write(self.generate_random_string())
+                    self._write_file(other_file, self._rng.choice(self._string_bytes_pool))
                 
                 # Create some .ipynb files (should also be counted)
-                num_ipynb = random.randint(0, 3)
+                num_ipynb = self._rng.randint(0, 3)
                 for j in range(num_ipynb):
                     ipynb_file = os.path.join(temp_dir, f"notebook{j}.ipynb")
-                    with open(ipynb_file, 'w') as f:
-                        f.write('{"cells": []}')
+                    self._write_file(ipynb_file, self._IPYNB_BYTES)
                 
                 result = mining.getPythonFileCount(temp_dir)
                 expected = num_py_files + num_ipynb
@@ -299,7 +578,7 @@ class Fuzzer:
                 self.reporter.log_test('getPythonFileCount', f"dir: {temp_dir}", None, e)
             finally:
                 try:
-                    shutil.rmtree(temp_dir)
+                    self._empty_scratch()
                 except:
                     pass
         
@@ -320,59 +599,28 @@ class Fuzzer:
             except Exception as e:
                 self.reporter.log_test('getPythonFileCount', f"dir: {dir_path}", None, e)
     
-#################### Method 5: Fuzz getDataLoadCount() ####################
-    def fuzz_getDataLoadCount(self, iterations=20):
-        print(f"\n[5/5] Fuzzing lint_engine.getDataLoadCount() with {iterations} iterations...")
-        
-        for i in range(iterations):
-            # Generate Python code with various data loading patterns
-            code_templates = [
-                "import torch\ntorch.load('file.pth')",
-                "import pickle\npickle.load(open('file.pkl', 'rb'))",
-                "import json\njson.load(open('file.json'))",
-                "import pandas as pd\npd.read_csv('data.csv')",
-                "from PIL import Image\nImage.open('image.jpg')",
-                self.generate_random_python_code(),
-                "",
-                "# no data loading here",
-                "import numpy as np\nnp.load('data.npy')",
-            ]
-            code = random.choice(code_templates)
-            temp_file = self.create_temp_python_file(code)
-            
-            try:
-                result = lint_engine.getDataLoadCount(temp_file)
-                self.reporter.log_test('getDataLoadCount', f"file: {temp_file}, code: {code[:50]}", result)
-            except Exception as e:
-                self.reporter.log_test('getDataLoadCount', f"file: {temp_file}, code: {code[:50]}", None, e)
-            finally:
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
-        
-        # Test with non-existent files
-        for i in range(5):
-            fake_file = '/nonexistent/' + self.generate_random_string() + '.py'
-            try:
-                result = lint_engine.getDataLoadCount(fake_file)
-                self.reporter.log_test('getDataLoadCount', f"file: {fake_file}", result)
-            except Exception as e:
-                self.reporter.log_test('getDataLoadCount', f"file: {fake_file}", None, e)
-    
-    def run_all_fuzzing(self, iterations=20):
+    def run_all_fuzzing(self, iterations=20, parallel=True):
         """Run all fuzzing tests"""
         print("="*80)
         print("STARTING FUZZING TESTS")
         print("="*80)
         print(f"Running {iterations} iterations per method...")
-        
-        self.fuzz_getPythonParseObject(iterations)
-        self.fuzz_checkLoggingPerData(iterations)
-        self.fuzz_days_between(iterations)
-        self.fuzz_getPythonFileCount(iterations)
-        self.fuzz_getDataLoadCount(iterations)
-        
+
+        if parallel:
+            # The entry points touch independent modules and files, so
+            # fan them out one-per-worker and merge the results
+            base_seed = self._seed if self._seed is not None else self._rng.randrange(2**32)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(self.FUZZ_METHODS)) as executor:
+                futures = [
+                    executor.submit(_run_fuzz_method, name, iterations, self.use_disk, base_seed + i)
+                    for i, name in enumerate(self.FUZZ_METHODS)
+                ]
+                for future in futures:
+                    self.reporter.merge_worker_state(future.result())
+        else:
+            for name in self.FUZZ_METHODS:
+                getattr(self, name)(iterations)
+
         print("\n" + "="*80)
         print("FUZZING COMPLETE")
         print("="*80)
@@ -380,6 +628,20 @@ class Fuzzer:
         self.reporter.generate_report()
 
 
+# Top-level so ProcessPoolExecutor can pickle it; each worker runs one
+# fuzz method with its own seeded Fuzzer and hands its results back
+def _run_fuzz_method(method_name, iterations, use_disk, seed):
+    # report_file=None keeps workers away from the parent's report file
+    fuzzer = Fuzzer(use_disk=use_disk, seed=seed, report_file=None)
+    try:
+        getattr(fuzzer, method_name)(iterations)
+    finally:
+        # Pool workers exit without running atexit handlers, so drop
+        # the scratch directory here instead
+        shutil.rmtree(fuzzer._scratch, ignore_errors=True)
+    return fuzzer.reporter.worker_state()
+
+
 def main():
     print("""
     =========================================================================
@@ -389,16 +651,26 @@ def main():
     """)
     
     # Allow custom iteration count from command line
-    iterations = 20
-    if len(sys.argv) > 1:
-        try:
-            iterations = int(sys.argv[1])
-            print(f"Using custom iteration count: {iterations}")
-        except ValueError:
-            print("Invalid iteration count, using default: 20")
-    
-    fuzzer = Fuzzer()
-    fuzzer.run_all_fuzzing(iterations)
+    parser = argparse.ArgumentParser(description='Fuzzer for MLForensics')
+    parser.add_argument('iterations', nargs='?', type=int, default=20,
+                        help='number of iterations per fuzzed method (default: 20)')
+    parser.add_argument('--disk', action='store_true',
+                        help='use the original tempfile-per-iteration path instead of in-memory parsing')
+    parser.add_argument('--sequential', action='store_true',
+                        help='run the fuzz methods one after another instead of in parallel workers')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='RNG seed for a reproducible run (default: random)')
+    args = parser.parse_args()
+
+    if args.iterations != 20:
+        print(f"Using custom iteration count: {args.iterations}")
+
+    # Always run with a concrete seed so crashes can be replayed
+    seed = args.seed if args.seed is not None else int.from_bytes(os.urandom(8), 'little')
+    print(f"Using seed: {seed}")
+
+    fuzzer = Fuzzer(use_disk=args.disk, seed=seed)
+    fuzzer.run_all_fuzzing(args.iterations, parallel=not args.sequential)
     
     print("\n✓ Fuzzing session completed successfully!")
     print("Check 'fuzz_report.txt' for detailed results.")